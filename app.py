@@ -1,17 +1,39 @@
-from typing import List, Dict, Any, Tuple, Optional, Set
+from typing import List, Dict, Any, Tuple, Optional, Set, FrozenSet
 from dataclasses import dataclass
 from pathlib import Path
+import argparse
+import asyncio
+import atexit
+import hashlib
+import importlib.util
 import itertools
 import json
 import logging
+import queue
+import random
+import time
+from collections import deque
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 import anthropic
-import Levenshtein
+import orjson
 from enum import Enum
+import numpy as np
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
-from image_distortions import ImageDistorter
+from image_distortions import ImageDistorter, ENCODED_MEDIA_TYPE, MAX_IMAGE_EDGE
+from llm_cache import LLMCache
+
+# StringZilla 4.x moved edit distances to the separate stringzillas package
+try:
+    from stringzilla import edit_distance as _sz_edit_distance
+except ImportError:
+    _sz_edit_distance = None
+
+try:
+    from rapidfuzz.distance.Levenshtein import distance as _rf_edit_distance
+except ImportError:
+    from Levenshtein import distance as _rf_edit_distance
 
 # I'm doing AI test validation for the Claude API related to image OCR for a form.
 # I need a python script which does the following:
@@ -29,12 +51,68 @@ from image_distortions import ImageDistorter
 #    in one of two buckets: correct or incorrect, and a categorization on why it
 #    was incorrect (hallucination/made stuff up, partially incorrect or didn't extract anything.
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    filename=f'ocr_validation_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log',
+# Set up logging; callers only enqueue records and a background listener
+# thread does the file writes
+log_file_handler = logging.FileHandler(
+    f'ocr_validation_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+)
+log_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 )
+log_queue: queue.Queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, log_file_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+logging.getLogger().addHandler(QueueHandler(log_queue))
+logging.getLogger().setLevel(logging.INFO)
+
+CLAUDE_MODEL = "claude-3-sonnet-20240229"
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+# Base image files with these suffixes can be sent to Claude as stored on disk
+MEDIA_TYPES = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png"}
+# Claude downscales images before tokenizing, so a single image never costs
+# more than roughly this many input tokens regardless of its base64 size
+MAX_IMAGE_TOKENS = 1600
+# Distortion subsets scoring below this are treated as failed extractions
+# when pruning their supersets
+PRUNE_DISTANCE_THRESHOLD = 0.1
+
+
+def _json_bytes(obj: Any, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """
+    Serialize obj to JSON bytes with orjson
+
+    orjson rejects integers beyond 64 bits, which Claude may return for
+    account or ID numbers, so those payloads fall back to the json module
+    with matching compact separators and UTF-8 output.
+    """
+    option = (orjson.OPT_SORT_KEYS if sort_keys else 0) | (
+        orjson.OPT_INDENT_2 if indent else 0
+    )
+    try:
+        return orjson.dumps(obj, option=option)
+    except orjson.JSONEncodeError:
+        return json.dumps(
+            obj,
+            sort_keys=sort_keys,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+            ensure_ascii=False,
+        ).encode()
+
+
+def _edit_distance(a: bytes, b: bytes) -> int:
+    """
+    Levenshtein distance between two byte strings
+
+    Uses StringZilla's SIMD edit_distance when the installed release still
+    provides it (it was removed in 4.0), otherwise rapidfuzz's C++
+    implementation, which python-Levenshtein also wraps.
+    """
+    if _sz_edit_distance is not None:
+        return _sz_edit_distance(a, b)
+    return _rf_edit_distance(a, b)
 
 
 class ErrorCategory(Enum):
@@ -57,6 +135,61 @@ class ValidationResult:
     levenshtein_distance: float
     error_category: ErrorCategory
     claude_analysis: Optional[str] = None
+    # True when the Claude request failed, as opposed to returning nothing
+    extraction_failed: bool = False
+
+
+class TokenBudgetTracker:
+    """Sliding-window token budget to keep requests under a tokens-per-minute limit"""
+
+    def __init__(self, tokens_per_minute: int, window_seconds: float = 60.0):
+        """
+        Initialize the token budget tracker
+
+        Args:
+            tokens_per_minute: Maximum number of tokens allowed per window
+            window_seconds: Length of the sliding window in seconds
+        """
+        self.tokens_per_minute = tokens_per_minute
+        self.window_seconds = window_seconds
+        self.usage: deque = deque()  # (timestamp, tokens)
+        self.reserved = 0
+        self._lock = asyncio.Lock()
+
+    def _prune(self, now: float) -> None:
+        """Drop usage records older than the window"""
+        while self.usage and now - self.usage[0][0] > self.window_seconds:
+            self.usage.popleft()
+
+    async def wait_for_capacity(self, estimated_tokens: int) -> None:
+        """
+        Wait until the window has room for estimated_tokens, then reserve them
+
+        A request larger than the whole budget is let through once the window
+        is empty so that it cannot block forever.
+        """
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._prune(now)
+                used = sum(tokens for _, tokens in self.usage) + self.reserved
+                if used + estimated_tokens <= self.tokens_per_minute or not used:
+                    self.reserved += estimated_tokens
+                    return
+                wait = (
+                    self.usage[0][0] + self.window_seconds - now
+                    if self.usage
+                    else 1.0
+                )
+            await asyncio.sleep(max(wait, 0.1))
+
+    def release(self, estimated_tokens: int) -> None:
+        """Release a reservation made by wait_for_capacity"""
+        self.reserved -= estimated_tokens
+
+    def record_usage(self, tokens: int) -> None:
+        """Record the tokens actually consumed by a request"""
+        self.usage.append((time.monotonic(), tokens))
 
 
 class OCRValidator:
@@ -67,6 +200,12 @@ class OCRValidator:
         distortion_list: List[str],
         levenshtein_threshold: float = 0.8,
         perform_claude_analysis: bool = True,
+        perform_cache: bool = True,
+        max_concurrent: int = 8,
+        max_images: int = 4,
+        max_retries: int = 5,
+        tokens_per_minute: int = 80000,
+        prune_failures: bool = True,
     ):
         """
         Initialize the OCR validator
@@ -77,41 +216,164 @@ class OCRValidator:
             distortion_list: List of possible distortions to apply
             levenshtein_threshold: Threshold for determining if Claude analysis is needed
             perform_claude_analysis: Whether to perform additional Claude analysis on mismatches
+            perform_cache: Whether to reuse cached Claude extractions from disk
+            max_concurrent: Maximum number of in-flight Claude requests
+            max_images: Maximum number of images decoded and validated at once
+            max_retries: Maximum number of retries on rate limit errors
+            tokens_per_minute: Token budget per minute shared by all requests
+            prune_failures: Whether to skip supersets of distortion sets that
+                already failed to extract
         """
-        self.client = anthropic.Client(api_key=api_key)
+        # HTTP/2 multiplexes concurrent requests over a few pooled connections;
+        # without h2 the pool falls back to HTTP/1.1. The limits are built with
+        # the SDK's own class since it may not use the httpx package itself.
+        limits_cls = type(anthropic.DEFAULT_CONNECTION_LIMITS)
+        http_client = anthropic.DefaultAsyncHttpxClient(
+            http2=HTTP2_AVAILABLE,
+            limits=limits_cls(
+                max_connections=max_concurrent * 4,
+                max_keepalive_connections=max_concurrent * 4,
+            ),
+            timeout=60.0,
+        )
+        # create_message owns the retry loop, so the SDK must not retry 429s
+        # itself while holding a concurrency slot and token reservation
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key, http_client=http_client, max_retries=0
+        )
         self.base_image_dir = Path(base_image_dir)
         self.distortion_list = distortion_list
         self.levenshtein_threshold = levenshtein_threshold
         self.perform_claude_analysis = perform_claude_analysis
+        self.prune_failures = prune_failures
+        self.cache = LLMCache() if perform_cache else None
+        self.max_retries = max_retries
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self._image_sem = asyncio.Semaphore(max_images)
+        self.token_tracker = TokenBudgetTracker(tokens_per_minute)
         self.results: List[ValidationResult] = []
+        # Claude analysis tasks keyed by a hash of the (true, extracted) JSON
+        # pair, so concurrent callers share one in-flight request
+        self._analysis_cache: Dict[str, "asyncio.Task[str]"] = {}
 
-    def encode_image(self, image_path: Path) -> str:
-        """Convert image to base64 string"""
+    def load_image(self, image_path: Path) -> Image.Image:
+        """Decode an image once so that all distortion subsets share its pixels"""
         with Image.open(image_path) as img:
-            return ImageDistorter.encode_image(img)
+            image = img.convert("RGB")
+        image.load()
+        return image
 
-    def apply_distortions(self, image_path: Path, distortions: List[str]) -> str:
-        """Apply specified distortions to an image"""
-        with Image.open(image_path) as img:
-            distorted = ImageDistorter.apply_distortions(img, distortions)
-            return ImageDistorter.encode_image(distorted)
+    def encode_image(self, image_path: Path, image: Image.Image) -> Tuple[str, str]:
+        """
+        Convert the undistorted image to base64 string
+
+        Files that Claude accepts and that are already within MAX_IMAGE_EDGE
+        are sent as stored on disk, skipping a decode/re-encode round trip.
 
-    def get_claude_extraction(
-        self, image_base64: str, system_prompt: str
-    ) -> Dict[str, Any]:
+        Returns:
+            Tuple of (base64 string, media type)
+        """
+        media_type = MEDIA_TYPES.get(image_path.suffix.lower())
+        if media_type and max(image.size) <= MAX_IMAGE_EDGE:
+            return ImageDistorter.encode_image_path(image_path), media_type
+        return self.apply_distortions(image, []), ENCODED_MEDIA_TYPE
+
+    def apply_distortions(self, image: Image.Image, distortions: List[str]) -> str:
+        """
+        Apply specified distortions to a decoded image and encode the result
+
+        Args:
+            image: Decoded image shared across distortion subsets (not modified)
+            distortions: Distortions to apply
+        """
+        if distortions:
+            image = ImageDistorter.apply_distortions(image, distortions)
+        return ImageDistorter.encode_image(image)
+
+    async def create_message(self, estimated_tokens: int, **kwargs) -> Any:
+        """
+        Call the Claude messages API, bounded by the concurrency semaphore and
+        the token budget
+
+        Rate limited, overloaded and dropped requests are retried with the
+        Retry-After header, or exponential backoff with jitter when the
+        header is missing.
+
+        Args:
+            estimated_tokens: Upper estimate of input plus output tokens
+            **kwargs: Arguments passed to client.messages.create
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.token_tracker.wait_for_capacity(estimated_tokens)
+            try:
+                async with self._sem:
+                    response = await self.client.messages.create(**kwargs)
+            except (anthropic.APIStatusError, anthropic.APIConnectionError) as e:
+                # Retry the same statuses the SDK would: timeouts, conflicts,
+                # rate limits, server errors and overloads
+                retryable = isinstance(e, anthropic.APIConnectionError) or (
+                    e.status_code in (408, 409, 429) or e.status_code >= 500
+                )
+                if not retryable or attempt == self.max_retries:
+                    raise
+                error_name = type(e).__name__
+                error_response = getattr(e, "response", None)
+                retry_after = (
+                    error_response.headers.get("retry-after")
+                    if error_response is not None
+                    else None
+                )
+                delay = (
+                    float(retry_after)
+                    if retry_after
+                    else 2**attempt + random.random()
+                )
+            else:
+                self.token_tracker.record_usage(
+                    response.usage.input_tokens + response.usage.output_tokens
+                )
+                return response
+            finally:
+                self.token_tracker.release(estimated_tokens)
+
+            logging.warning(f"{error_name}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def get_claude_extraction(
+        self,
+        image_base64: str,
+        system_prompt: str,
+        media_type: str = ENCODED_MEDIA_TYPE,
+    ) -> Optional[Dict[str, Any]]:
         """
         Get OCR extraction from Claude for a given image
 
         Args:
             image_base64: Base64 encoded image
             system_prompt: Instructions for Claude on how to process the image
+            media_type: Media type of the encoded image
 
         Returns:
-            Dictionary containing extracted information
+            Dictionary containing extracted information, or None if the
+            request failed or the reply was not valid JSON
         """
+        cache_key = hashlib.sha256(
+            (system_prompt + image_base64 + CLAUDE_MODEL).encode()
+        ).hexdigest()
         try:
-            response = self.client.messages.create(
-                model="claude-3-sonnet-20240229",
+            if self.cache is not None:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return json.loads(cached)
+
+            estimated_tokens = (
+                min(len(image_base64) // 4, MAX_IMAGE_TOKENS)
+                + len(system_prompt) // 4
+                + 1000
+            )
+            response = await self.create_message(
+                estimated_tokens,
+                model=CLAUDE_MODEL,
                 max_tokens=1000,
                 messages=[
                     {
@@ -122,7 +384,7 @@ class OCRValidator:
                                 "type": "image",
                                 "source": {
                                     "type": "base64",
-                                    "media_type": "image/jpeg",
+                                    "media_type": media_type,
                                     "data": image_base64,
                                 },
                             },
@@ -130,29 +392,37 @@ class OCRValidator:
                     }
                 ],
             )
-            return json.loads(response.content[0].text)
+            text = response.content[0].text
+            extracted = json.loads(text)
+            if self.cache is not None:
+                self.cache.set(cache_key, text)
+            return extracted
         except Exception as e:
             logging.error(f"Error in Claude extraction: {str(e)}")
-            return {}
+            return None
 
     def compare_results(
-        self, true_json: Dict[str, Any], extracted_json: Dict[str, Any]
+        self, true_bytes: bytes, extracted_json: Dict[str, Any]
     ) -> Tuple[float, ErrorCategory]:
         """
         Compare true and extracted JSON results
 
+        Args:
+            true_bytes: True JSON serialized with sorted keys
+            extracted_json: Extracted JSON to compare against it
+
         Returns:
             Tuple of (Levenshtein distance, error category)
         """
         if not extracted_json:
             return 0.0, ErrorCategory.NO_EXTRACTION
 
-        # Convert both JSONs to strings for comparison
-        true_str = json.dumps(true_json, sort_keys=True)
-        extracted_str = json.dumps(extracted_json, sort_keys=True)
+        # Convert the extracted JSON to bytes for comparison
+        extracted_bytes = _json_bytes(extracted_json, sort_keys=True)
 
-        # Calculate Levenshtein distance
-        distance = Levenshtein.ratio(true_str, extracted_str)
+        # Calculate Levenshtein similarity
+        edit_distance = _edit_distance(true_bytes, extracted_bytes)
+        distance = 1 - edit_distance / max(len(true_bytes), len(extracted_bytes), 1)
 
         # Categorize error
         if distance == 1.0:
@@ -162,94 +432,191 @@ class OCRValidator:
         else:
             return distance, ErrorCategory.PARTIAL_INCORRECT
 
-    def get_claude_analysis(
+    async def get_claude_analysis(
         self, true_json: Dict[str, Any], extracted_json: Dict[str, Any]
     ) -> str:
         """
         Get Claude's analysis of differences between true and extracted JSON
+
+        Identical (true, extracted) pairs are only sent to Claude once, even
+        when they are requested concurrently. A failed request is forgotten so
+        that a later caller can retry it.
         """
+        cache_key = hashlib.sha256(
+            _json_bytes((true_json, extracted_json), sort_keys=True)
+            + CLAUDE_MODEL.encode()
+        ).hexdigest()
+        task = self._analysis_cache.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._request_claude_analysis(cache_key, true_json, extracted_json)
+            )
+            self._analysis_cache[cache_key] = task
+        try:
+            # Shield the shared task so one cancelled caller does not cancel it
+            # for the others
+            return await asyncio.shield(task)
+        except Exception:
+            if self._analysis_cache.get(cache_key) is task:
+                del self._analysis_cache[cache_key]
+            raise
+
+    async def _request_claude_analysis(
+        self, cache_key: str, true_json: Dict[str, Any], extracted_json: Dict[str, Any]
+    ) -> str:
+        """Fetch an analysis from the disk cache or Claude"""
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        true_values = _json_bytes(true_json, indent=True).decode()
+        extracted_values = _json_bytes(extracted_json, indent=True).decode()
+
         prompt = f"""
         Compare these two JSON outputs and explain the differences:
-        True values: {json.dumps(true_json, indent=2)}
-        Extracted values: {json.dumps(extracted_json, indent=2)}
+        True values: {true_values}
+        Extracted values: {extracted_values}
         
         Please provide a detailed analysis of the differences and potential reasons for the discrepancies.
         """
 
-        response = self.client.messages.create(
-            model="claude-3-sonnet-20240229",
+        response = await self.create_message(
+            len(prompt) // 4 + 500,
+            model=CLAUDE_MODEL,
             max_tokens=500,
             messages=[{"role": "user", "content": prompt}],
         )
-        return response.content[0].text
+        analysis = response.content[0].text
+        if self.cache is not None:
+            self.cache.set(cache_key, analysis)
+        return analysis
 
-    def validate_image(self, image_path: Path) -> List[ValidationResult]:
+    async def validate_image(self, image_path: Path) -> List[ValidationResult]:
         """
         Validate a single image with all possible distortion combinations
-        """
-        results = []
 
-        # Get base truth first
-        base_image = self.encode_image(image_path)
-        true_json = self.get_claude_extraction(
-            base_image, "Extract form fields and return as JSON"
+        Returns no results if the base truth extraction fails.
+        """
+        # Decode the image once, then get base truth first
+        image = await asyncio.to_thread(self.load_image, image_path)
+        base_image, media_type = await asyncio.to_thread(
+            self.encode_image, image_path, image
         )
-
-        # Generate all possible distortion combinations
-        for r in range(len(self.distortion_list) + 1):
+        true_json = await self.get_claude_extraction(
+            base_image, "Extract form fields and return as JSON", media_type
+        )
+        if true_json is None:
+            # Without a base truth the distortions cannot be scored, and
+            # scoring against {} would blame the failure on them
+            logging.error(f"Skipping {image_path.name}: base truth extraction failed")
+            return []
+        true_bytes = _json_bytes(true_json, sort_keys=True)
+
+        # Generate all possible distortion combinations in increasing size,
+        # skipping the empty distortion set (already handled as base truth)
+        results = []
+        failing: Set[FrozenSet[str]] = set()
+        for r in range(1, len(self.distortion_list) + 1):
+            tasks = []
             for distortions in itertools.combinations(self.distortion_list, r):
-                if (
-                    not distortions
-                ):  # Skip empty distortion set (already handled as base truth)
+                subset = frozenset(distortions)
+                if any(f.issubset(subset) for f in failing):
+                    # A subset already failed, so skip the Claude call and
+                    # record the superset as a failed extraction
+                    results.append(
+                        ValidationResult(
+                            image_name=image_path.name,
+                            distortions=list(distortions),
+                            true_json=true_json,
+                            extracted_json={},
+                            levenshtein_distance=0.0,
+                            error_category=ErrorCategory.NO_EXTRACTION,
+                        )
+                    )
+                    logging.info(
+                        f"Pruned {image_path.name} with distortions {distortions}"
+                    )
                     continue
-
-                # Apply distortions and get extraction
-                distorted_image = self.apply_distortions(image_path, list(distortions))
-                extracted_json = self.get_claude_extraction(
-                    distorted_image, "Extract form fields and return as JSON"
-                )
-
-                # Compare results
-                distance, error_category = self.compare_results(
-                    true_json, extracted_json
+                tasks.append(
+                    self.validate_distortions(
+                        image_path, image, true_json, true_bytes, list(distortions)
+                    )
                 )
 
-                # Get Claude analysis if needed
-                claude_analysis = None
+            for result in await asyncio.gather(*tasks):
+                results.append(result)
+                # Failed requests say nothing about the distortions, so only
+                # genuine empty or poor extractions prune their supersets
                 if (
-                    self.perform_claude_analysis
-                    and distance < self.levenshtein_threshold
-                ):
-                    claude_analysis = self.get_claude_analysis(
-                        true_json, extracted_json
+                    self.prune_failures
+                    and not result.extraction_failed
+                    and (
+                        result.error_category == ErrorCategory.NO_EXTRACTION
+                        or result.levenshtein_distance < PRUNE_DISTANCE_THRESHOLD
                     )
+                ):
+                    failing.add(frozenset(result.distortions))
 
-                # Store results
-                result = ValidationResult(
-                    image_name=image_path.name,
-                    distortions=list(distortions),
-                    true_json=true_json,
-                    extracted_json=extracted_json,
-                    levenshtein_distance=distance,
-                    error_category=error_category,
-                    claude_analysis=claude_analysis,
-                )
-                results.append(result)
+        return results
 
-                # Log results
-                logging.info(
-                    f"Processed {image_path.name} with distortions {distortions}"
-                )
-                logging.info(f"Error category: {error_category}, Distance: {distance}")
+    async def validate_distortions(
+        self,
+        image_path: Path,
+        image: Image.Image,
+        true_json: Dict[str, Any],
+        true_bytes: bytes,
+        distortions: List[str],
+    ) -> ValidationResult:
+        """
+        Validate a single distortion combination of an image against its base truth
+        """
+        # Apply distortions and get extraction
+        distorted_image = await asyncio.to_thread(
+            self.apply_distortions, image, distortions
+        )
+        extracted_json = await self.get_claude_extraction(
+            distorted_image, "Extract form fields and return as JSON"
+        )
+        extraction_failed = extracted_json is None
+        if extraction_failed:
+            extracted_json = {}
+
+        # Compare results off the event loop; edit distance on large replies is
+        # CPU-bound
+        distance, error_category = await asyncio.to_thread(
+            self.compare_results, true_bytes, extracted_json
+        )
 
-        return results
+        # Get Claude analysis if needed
+        claude_analysis = None
+        if self.perform_claude_analysis and distance < self.levenshtein_threshold:
+            claude_analysis = await self.get_claude_analysis(
+                true_json, extracted_json
+            )
 
-    def run_validation(self, max_workers: int = 4) -> pd.DataFrame:
+        # Log results
+        logging.info(f"Processed {image_path.name} with distortions {distortions}")
+        logging.info(f"Error category: {error_category}, Distance: {distance}")
+
+        return ValidationResult(
+            image_name=image_path.name,
+            distortions=distortions,
+            true_json=true_json,
+            extracted_json=extracted_json,
+            levenshtein_distance=distance,
+            error_category=error_category,
+            claude_analysis=claude_analysis,
+            extraction_failed=extraction_failed,
+        )
+
+    async def run_validation(self) -> pd.DataFrame:
         """
         Run validation on all images in the directory
 
-        Args:
-            max_workers: Maximum number of parallel workers
+        Up to max_images images are validated at once, which bounds how many
+        decoded images are held in memory; the number of in-flight Claude
+        calls across them is bounded by max_concurrent.
 
         Returns:
             DataFrame with validation statistics
@@ -258,25 +625,37 @@ class OCRValidator:
             self.base_image_dir.glob("*.png")
         )
 
-        # Process images in parallel
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            all_results = list(executor.map(self.validate_image, image_paths))
+        async def validate_bounded(image_path: Path) -> List[ValidationResult]:
+            async with self._image_sem:
+                return await self.validate_image(image_path)
+
+        all_results = await asyncio.gather(
+            *(validate_bounded(image_path) for image_path in image_paths)
+        )
 
         # Flatten results
         self.results = [result for sublist in all_results for result in sublist]
 
-        # Create DataFrame for analysis
+        # Create DataFrame for analysis from per-column arrays
         df = pd.DataFrame(
-            [
-                {
-                    "image_name": r.image_name,
-                    "distortions": ",".join(r.distortions),
-                    "levenshtein_distance": r.levenshtein_distance,
-                    "error_category": r.error_category.value,
-                    "has_claude_analysis": bool(r.claude_analysis),
-                }
-                for r in self.results
-            ]
+            {
+                "image_name": [r.image_name for r in self.results],
+                "distortions": [",".join(r.distortions) for r in self.results],
+                "levenshtein_distance": np.fromiter(
+                    (r.levenshtein_distance for r in self.results),
+                    dtype=np.float32,
+                    count=len(self.results),
+                ),
+                "error_category": pd.Categorical(
+                    [r.error_category.value for r in self.results],
+                    categories=[e.value for e in ErrorCategory],
+                ),
+                "has_claude_analysis": np.fromiter(
+                    (bool(r.claude_analysis) for r in self.results),
+                    dtype=bool,
+                    count=len(self.results),
+                ),
+            }
         )
 
         # Generate and log statistics
@@ -292,7 +671,7 @@ class OCRValidator:
             "no_extraction": len(
                 df[df.error_category == ErrorCategory.NO_EXTRACTION.value]
             ),
-            "average_levenshtein": df.levenshtein_distance.mean(),
+            "average_levenshtein": float(df.levenshtein_distance.mean()),
         }
 
         logging.info("Validation Statistics:")
@@ -303,15 +682,26 @@ class OCRValidator:
 
 def main():
     """Example usage of the OCRValidator"""
+    parser = argparse.ArgumentParser(
+        description="Validate Claude OCR on distorted images"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached Claude extractions and always call the API",
+    )
+    args = parser.parse_args()
+
     validator = OCRValidator(
         api_key="your-api-key",
         base_image_dir=Path("./images"),
         distortion_list=["blur", "noise", "rotation", "compression"],
         levenshtein_threshold=0.8,
         perform_claude_analysis=True,
+        perform_cache=not args.no_cache,
     )
 
-    results_df = validator.run_validation()
+    results_df = asyncio.run(validator.run_validation())
 
     # Save results to CSV
     results_df.to_csv(
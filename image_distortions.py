@@ -4,6 +4,22 @@ from typing import List
 import io
 import base64
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+
+    _tj = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    _tj = None
+
+_rng = np.random.default_rng()
+
+# Claude rescales images to roughly this long edge, so larger uploads only
+# cost bandwidth and input tokens
+MAX_IMAGE_EDGE = 1568
+# Encoded images are lossless, so distorted subsets only differ from the
+# base image by the distortions themselves
+ENCODED_MEDIA_TYPE = "image/png"
+
 
 class ImageDistorter:
     @staticmethod
@@ -14,10 +30,13 @@ class ImageDistorter:
     @staticmethod
     def noise(image: Image.Image, factor: float = 0.1) -> Image.Image:
         """Add random noise to image"""
-        img_array = np.array(image)
-        noise = np.random.normal(0, factor * 255, img_array.shape)
-        noisy_array = np.clip(img_array + noise, 0, 255).astype(np.uint8)
-        return Image.fromarray(noisy_array)
+        img_array = np.asarray(image)
+        # Draw float32 noise and add/clip in place to avoid float64 temporaries
+        noise = _rng.standard_normal(img_array.shape, dtype=np.float32)
+        noise *= factor * 255
+        noise += img_array
+        np.clip(noise, 0, 255, out=noise)
+        return Image.fromarray(noise.astype(np.uint8))
 
     @staticmethod
     def rotation(image: Image.Image, angle: float = 5.0) -> Image.Image:
@@ -27,6 +46,17 @@ class ImageDistorter:
     @staticmethod
     def compression(image: Image.Image, quality: int = 50) -> Image.Image:
         """Compress image using JPEG compression"""
+        if _tj is not None:
+            raw = _tj.encode(
+                np.asarray(image.convert("RGB")),
+                quality=quality,
+                pixel_format=TJPF_RGB,
+                # PIL saves with 4:2:0 chroma subsampling; match it so the
+                # distortion does not depend on which encoder is installed
+                jpeg_subsample=TJSAMP_420,
+            )
+            return Image.fromarray(_tj.decode(raw, pixel_format=TJPF_RGB))
+
         buffer = io.BytesIO()
         image.convert("RGB").save(buffer, format="JPEG", quality=quality)
         buffer.seek(0)
@@ -50,9 +80,21 @@ class ImageDistorter:
                 result = distortion_map[distortion](result)
         return result
 
+    @staticmethod
+    def encode_image_path(image_path) -> str:
+        """Convert an image file to base64 string without re-encoding it"""
+        with open(image_path, "rb") as f:
+            return base64.b64encode(f.read()).decode("utf-8")
+
     @staticmethod
     def encode_image(image: Image.Image) -> str:
-        """Convert PIL Image to base64 string"""
+        """Convert PIL Image to a base64 PNG, downscaled to MAX_IMAGE_EDGE"""
+        if max(image.size) > MAX_IMAGE_EDGE:
+            image = image.copy()
+            image.thumbnail((MAX_IMAGE_EDGE, MAX_IMAGE_EDGE), Image.LANCZOS)
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
         buffered = io.BytesIO()
-        image.save(buffered, format=image.format or "PNG")
+        image.save(buffered, format="PNG")
         return base64.b64encode(buffered.getvalue()).decode("utf-8")
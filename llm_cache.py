@@ -0,0 +1,34 @@
+from pathlib import Path
+from typing import Optional
+import json
+
+
+class LLMCache:
+    def __init__(self, cache_dir: Path = Path("data/llm_cache")):
+        """
+        Initialize a content-addressed disk cache for Claude responses
+
+        Args:
+            cache_dir: Directory where cached responses are stored
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for key, or None on a miss"""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["response"]
+
+    def set(self, key: str, value: str) -> None:
+        """Store the response text for key"""
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"response": value}, f)
+        tmp_path.replace(path)
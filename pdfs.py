@@ -1,11 +1,52 @@
-import pdfrw
-import pdf2image
-import pytesseract
-from pdf2image import convert_from_path
 from pypdf import PdfReader, PdfWriter
 from pypdf.generic import NameObject, BooleanObject, TextStringObject, IndirectObject
+import functools
+import hashlib
+import json
 import os
-from collections import OrderedDict
+import tempfile
+from binascii import unhexlify
+from io import BytesIO
+from codecs import utf_16_be_decode
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Pool
+
+
+@functools.lru_cache(maxsize=None)
+def _import_fitz():
+    """Import PyMuPDF on first use; returns None when it is not installed."""
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        return None
+    return fitz
+
+
+@functools.lru_cache(maxsize=None)
+def _import_tesserocr():
+    """Import tesserocr (and libtesseract) on first use; None when not installed."""
+    try:
+        import tesserocr
+    except ImportError:
+        return None
+    return tesserocr
+
+# PDF name objects are immutable, so build the ones used per field only once
+_ACROFORM = NameObject("/AcroForm")
+_NEED_APPEARANCES = NameObject("/NeedAppearances")
+_T = NameObject("/T")
+_V = NameObject("/V")
+_AS = NameObject("/AS")
+_OFF = NameObject("/Off")
+# Checked state used when a checkbox has no appearance states
+_DEFAULT_ON = NameObject("/1")
+
+# UTF-16 field names are written as hex strings with a byte order mark
+_FEFF_PREFIX = "<FEFF"
+
+# Fill plans depend only on the template, so they are cached across runs
+FILL_PLAN_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdf_processor")
 
 
 def set_need_appearances_writer(writer):
@@ -14,103 +55,371 @@ def set_need_appearances_writer(writer):
         catalog = writer._root_object
         if "/AcroForm" not in catalog:
             writer._root_object.update({
-                NameObject("/AcroForm"): IndirectObject(len(writer._objects), 0, writer)
+                _ACROFORM: IndirectObject(len(writer._objects), 0, writer)
             })
 
-        need_appearances = NameObject("/NeedAppearances")
-        writer._root_object["/AcroForm"][need_appearances] = BooleanObject(True)
+        writer._root_object["/AcroForm"][_NEED_APPEARANCES] = BooleanObject(True)
     except Exception as e:
         print(f"Error setting up appearances: {str(e)}")
 
 
-def get_checkbox_states(field_obj):
-    """Extract available states for a checkbox field."""
-    states = []
+def _extract_n_keys(obj):
+    """Return the non-/Off normal appearance state names of obj."""
+    if "/AP" not in obj:
+        return []
+    ap_dict = obj["/AP"].get_object()
+    if "/N" not in ap_dict:
+        return []
+    return [k for k in ap_dict["/N"].get_object().keys() if k != _OFF]
+
+
+def get_checkbox_states(field_obj, cache=None):
+    """
+    Extract available states for a checkbox field.
 
-    # Check for appearance states in the field
-    if "/AP" in field_obj:
-        ap_dict = field_obj["/AP"].get_object()
-        if "/N" in ap_dict:
-            n_dict = ap_dict["/N"].get_object()
-            states.extend(k for k in n_dict.keys() if k != "/Off")
+    When a cache dict is given, results are memoized by field object identity;
+    it must not outlive the document the fields belong to.
+    """
+    if cache is not None:
+        states = cache.get(id(field_obj))
+        if states is not None:
+            return states
 
-    # Check for states in field's kids
+    # Check for appearance states in the field and in its kids
+    states = _extract_n_keys(field_obj)
     if "/Kids" in field_obj:
         for kid in field_obj["/Kids"]:
-            kid_obj = kid.get_object()
-            if "/AP" in kid_obj:
-                ap_dict = kid_obj["/AP"].get_object()
-                if "/N" in ap_dict:
-                    n_dict = ap_dict["/N"].get_object()
-                    states.extend(k for k in n_dict.keys() if k != "/Off")
+            states.extend(_extract_n_keys(kid.get_object()))
 
     # Remove duplicates while preserving order
-    return list(OrderedDict.fromkeys(states))
+    states = list(dict.fromkeys(states))
+    if cache is not None:
+        cache[id(field_obj)] = states
+    return states
+
+
+def update_checkbox(obj, target_name, value, state_cache=None):
+    """Set a checkbox field to its checked state or /Off."""
+    # Get available checked states for this checkbox
+    checked_states = get_checkbox_states(obj, state_cache)
+    if not checked_states:
+        checked_states = [_DEFAULT_ON]  # Default if no states found
+
+    # Choose appropriate state based on value; state names are already NameObjects
+    checkbox_value = checked_states[0] if value else _OFF
+
+    print(f"Initial field state:")
+    print(f"Value: {obj.get('/V', 'None')}")
+    print(f"States: {checked_states + ['/Off']}")
+    print(f"Found target field: {target_name}")
+
+    obj[_V] = checkbox_value
+    if "/AS" in obj:
+        obj[_AS] = checkbox_value
+    return True
+
+
+def find_and_update_checkbox(fields, target_name, value, state_cache=None):
+    """
+    Find and update the first checkbox field whose name contains target_name.
+
+    Walks /Kids with an explicit stack. A parent's kids are checked before
+    descending into them, and the parent itself is checked after its subtree.
+    """
+    stack = [(iter(fields), None)]
+    while stack:
+        fields_iter, parent_obj = stack[-1]
+        field = next(fields_iter, None)
+        if field is None:
+            stack.pop()
+            # Check the parent once its kids have been searched
+            if (
+                parent_obj is not None
+                and _T in parent_obj
+                and target_name in parent_obj[_T]
+            ):
+                return update_checkbox(parent_obj, target_name, value, state_cache)
+            continue
 
-
-def find_and_update_checkbox(fields, target_name, value):
-    """Recursively find and update checkbox fields."""
-    for field in fields:
         field_obj = field.get_object()
 
-        # Function to update field value
-        def update_field(obj):
-            # Get available checked states for this checkbox
-            checked_states = get_checkbox_states(obj)
-            if not checked_states:
-                checked_states = ['/1']  # Default if no states found
-
-            # Choose appropriate state based on value
-            checkbox_value = checked_states[0] if value else "/Off"
-
-            print(f"Initial field state:")
-            print(f"Value: {obj.get('/V', 'None')}")
-            print(f"States: {checked_states + ['/Off']}")
-            print(f"Found target field: {target_name}")
-
-            obj[NameObject("/V")] = NameObject(checkbox_value)
-            if "/AS" in obj:
-                obj[NameObject("/AS")] = NameObject(checkbox_value)
-            return True
-
         # Check if this is a parent field with kids
         if "/Kids" in field_obj:
             for kid in field_obj["/Kids"]:
                 kid_obj = kid.get_object()
-                if "/T" in kid_obj and target_name in kid_obj["/T"]:
-                    return update_field(kid_obj)
-            if find_and_update_checkbox(field_obj["/Kids"], target_name, value):
-                return True
+                if _T in kid_obj and target_name in kid_obj[_T]:
+                    return update_checkbox(kid_obj, target_name, value, state_cache)
+            stack.append((iter(field_obj["/Kids"]), field_obj))
 
         # Check if this is the target field
-        if "/T" in field_obj and target_name in field_obj["/T"]:
-            return update_field(field_obj)
+        elif _T in field_obj and target_name in field_obj[_T]:
+            return update_checkbox(field_obj, target_name, value, state_cache)
 
     return False
 
 
+def _build_field_index(fields):
+    """
+    Map every field name in the /Fields tree to its field object.
+
+    Walks /Kids with an explicit stack in document order; names are indexed as
+    stored and without a trailing '[0]'. The first field with a name wins.
+    """
+    index = {}
+    stack = [iter(fields)]
+    while stack:
+        field = next(stack[-1], None)
+        if field is None:
+            stack.pop()
+            continue
+        field_obj = field.get_object()
+        if _T in field_obj:
+            name = str(field_obj[_T])
+            index.setdefault(name, field_obj)
+            if name.endswith("[0]"):
+                index.setdefault(name[:-3], field_obj)
+        if "/Kids" in field_obj:
+            stack.append(iter(field_obj["/Kids"]))
+    return index
+
+
+# JPEG quality used for rendered pages; high enough for OCR
+JPEG_QUALITY = 85
+# Fast zlib level for PNG pages; they are intermediates for OCR, not archives
+PNG_COMPRESS_LEVEL = 1
+
+
+def _render_page(input_pdf_path, page_index, output_dir, dpi, fmt):
+    """Render a single PDF page to an image and return its path (process pool worker)."""
+    extension = "jpg" if fmt == "JPEG" else "png"
+    image_path = os.path.join(output_dir, f"page_{page_index + 1}.{extension}")
+
+    fitz = _import_fitz()
+    if fitz is not None:
+        with fitz.open(input_pdf_path) as doc:
+            pixmap = doc.load_page(page_index).get_pixmap(dpi=dpi, alpha=False)
+            if fmt == "JPEG":
+                pixmap.save(image_path, jpg_quality=JPEG_QUALITY)
+            else:
+                pixmap.save(image_path)
+    else:
+        from pdf2image import convert_from_path
+
+        image = convert_from_path(
+            input_pdf_path, dpi=dpi, first_page=page_index + 1, last_page=page_index + 1
+        )[0]
+        if fmt == "JPEG":
+            image.save(image_path, "JPEG", quality=JPEG_QUALITY, optimize=False)
+        else:
+            image.save(image_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+
+    return image_path
+
+
+# Below this many pages, worker start-up costs more than parallel text extraction saves
+PARALLEL_TEXT_MIN_PAGES = 16
+
+
+def _extract_page_texts(input_pdf_path, start, stop):
+    """Extract text of pages start..stop-1 with PyMuPDF (process pool worker)."""
+    with _import_fitz().open(input_pdf_path) as doc:
+        return [doc.load_page(i).get_text("text") for i in range(start, stop)]
+
+
+def _set_omp_thread_limit(limit):
+    """Limit Tesseract's OpenMP threads in a worker process."""
+    os.environ["OMP_THREAD_LIMIT"] = str(limit)
+
+
 class PDFProcessor:
     def __init__(self, input_pdf_path):
         """Initialize with path to fillable PDF form."""
         self.input_pdf_path = input_pdf_path
-        self.template_pdf = pdfrw.PdfReader(input_pdf_path)
+        self._tess_api = None
+        self._fitz_doc = None
+        self._load_template()
+
+    def _load_template(self):
+        """Forget everything derived from the input PDF so it is rebuilt lazily."""
+        self._template_mtime = os.stat(self.input_pdf_path).st_mtime_ns
+        self._template_bytes = None
+        self._template_pdf = None
+        self._fields_cache = None
+        self._pypdf_reader = None
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+            self._fitz_doc = None
+        self._fill_plan = None
+
+    def _reload_if_modified(self):
+        """Re-parse the input PDF if it changed on disk since it was loaded."""
+        if os.stat(self.input_pdf_path).st_mtime_ns != self._template_mtime:
+            self._load_template()
+
+    @property
+    def template_bytes(self):
+        """Raw bytes of the input PDF, read once and shared by every parser."""
+        if self._template_bytes is None:
+            with open(self.input_pdf_path, 'rb') as pdf_file:
+                self._template_bytes = pdf_file.read()
+        return self._template_bytes
+
+    @property
+    def template_pdf(self):
+        """
+        pdfrw view of the input PDF, parsed on first use and reused.
 
-    def decode_pdf_field_name(self, field_name):
+        pdfrw is only needed to list form fields, so it is imported here rather
+        than at module load.
+        """
+        if self._template_pdf is None:
+            import pdfrw
+
+            self._template_pdf = pdfrw.PdfReader(fdata=self.template_bytes)
+        return self._template_pdf
+
+    @property
+    def pypdf_reader(self):
+        """pypdf reader for the input PDF, parsed on first use and reused."""
+        if self._pypdf_reader is None:
+            self._pypdf_reader = PdfReader(BytesIO(self.template_bytes))
+        return self._pypdf_reader
+
+    @property
+    def fitz_doc(self):
+        """PyMuPDF document for the input PDF, opened on first use and reused."""
+        if self._fitz_doc is None:
+            self._fitz_doc = _import_fitz().open(
+                stream=self.template_bytes, filetype="pdf"
+            )
+        return self._fitz_doc
+
+    def _get_fill_plan(self):
+        """Return the fill plan, building or loading it on first use."""
+        if self._fill_plan is None:
+            self._fill_plan = self._build_or_load_plan()
+        return self._fill_plan
+
+    def _build_or_load_plan(self):
+        """
+        Map field names to (page index, annotation index, is_checkbox).
+
+        The plan lets fill_form jump straight to each field's annotation. It
+        is stored as JSON under FILL_PLAN_CACHE_DIR, one file per PDF path
+        tagged with the PDF's modification time, so later runs skip the walk
+        entirely. The cache is best-effort: stale or unreadable entries are
+        rebuilt and write failures ignored.
+        """
+        key = hashlib.sha256(
+            os.path.abspath(self.input_pdf_path).encode()
+        ).hexdigest()
+        plan_path = os.path.join(FILL_PLAN_CACHE_DIR, f"{key}.json")
+
+        try:
+            with open(plan_path, 'r', encoding='utf-8') as plan_file:
+                cached = json.load(plan_file)
+            if cached["mtime_ns"] == self._template_mtime:
+                return {
+                    name: (page_index, annot_index, is_btn)
+                    for name, (page_index, annot_index, is_btn)
+                    in cached["plan"].items()
+                }
+        except (OSError, ValueError, TypeError, KeyError):
+            pass
+
+        plan = {}
+        for page_index, page in enumerate(self.pypdf_reader.pages):
+            if "/Annots" not in page:
+                continue
+            for annot_index, annot in enumerate(page["/Annots"]):
+                annot_obj = annot.get_object()
+                if _T not in annot_obj:
+                    continue
+
+                # Widgets may inherit their field type from the parent field
+                field_type = annot_obj.get("/FT")
+                if field_type is None and "/Parent" in annot_obj:
+                    field_type = annot_obj["/Parent"].get("/FT")
+
+                plan.setdefault(
+                    str(annot_obj[_T]), (page_index, annot_index, field_type == "/Btn")
+                )
+
+        # Write atomically since batch fill workers may build plans concurrently
+        tmp_path = f"{plan_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(FILL_PLAN_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as plan_file:
+                json.dump({"mtime_ns": self._template_mtime, "plan": plan}, plan_file)
+            os.replace(tmp_path, plan_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+        return plan
+
+    def __del__(self):
+        """Release the Tesseract API and PyMuPDF document if they were created."""
+        if getattr(self, "_tess_api", None) is not None:
+            self._tess_api.End()
+        if getattr(self, "_fitz_doc", None) is not None:
+            self._fitz_doc.close()
+
+    def _get_tess_api(self):
+        """Return the in-process Tesseract API, initializing it on first use."""
+        if self._tess_api is None:
+            self._tess_api = _import_tesserocr().PyTessBaseAPI(lang="eng")
+        return self._tess_api
+
+    def _index_annotations(self):
+        """
+        Map decoded field names to their annotations in a single pass over the
+        template, ordered top to bottom on each page.
+        """
+        index = {}
+        decode = self.decode_pdf_field_name
+
+        for page in self.template_pdf.pages:
+            if page.Annots:
+                # Read each annotation's negated y-coordinate and raw name once,
+                # so an ascending sort orders them top to bottom
+                records = [
+                    (-float(annot.Rect[1]), str(raw_key), annot)
+                    for annot in page.Annots
+                    if (raw_key := annot.T) and hasattr(annot, 'Rect')
+                ]
+                records.sort(key=itemgetter(0))
+
+                for _, raw_key, annotation in records:
+                    index[decode(raw_key)] = annotation
+
+        return index
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def decode_pdf_field_name(field_name):
         """
         Decode PDF form field names from UTF-16 encoding.
         Handles the '<FEFF...>' format commonly found in PDF forms.
+
+        Results are cached since the same names are decoded repeatedly.
         """
         if not field_name:
             return ""
 
         # Remove the '<FEFF' prefix and '>' suffix if present
-        if field_name.startswith("<FEFF") and field_name.endswith(">"):
-            field_name = field_name[5:-1]
+        if (
+            field_name[0] == "<"
+            and field_name[-1] == ">"
+            and field_name.startswith(_FEFF_PREFIX)
+        ):
+            field_name = field_name[len(_FEFF_PREFIX):-1]
 
         try:
             # Convert hex string to bytes and decode as UTF-16
-            bytes_data = bytes.fromhex(field_name)
-            decoded = bytes_data.decode("utf-16-be")
+            decoded, _ = utf_16_be_decode(unhexlify(field_name), "strict", True)
 
             # Remove common suffixes like '[0]' that appear in form fields
             if decoded.endswith("[0]"):
@@ -127,7 +436,7 @@ class PDFProcessor:
         """
         # Convert to UTF-16-BE bytes and then to hex
         hex_data = field_name.encode("utf-16-be").hex().upper()
-        return f"<FEFF{hex_data}>"
+        return f"{_FEFF_PREFIX}{hex_data}>"
 
     def is_checkbox(self, annotation):
         """
@@ -147,116 +456,261 @@ class PDFProcessor:
                              - For checkboxes: boolean values (True/False)
             output_path (str): Path where to save the filled PDF
         """
-        # Create PDF reader and writer
-        reader = PdfReader(self.input_pdf_path)
+        self._reload_if_modified()
+
+        fill_plan = self._get_fill_plan()
+
+        # Create PDF writer from the cached reader; cloning leaves the reader untouched
         writer = PdfWriter()
-        writer.clone_reader_document_root(reader)
+        writer.clone_reader_document_root(self.pypdf_reader)
 
         # Get AcroForm and fields
         if "/AcroForm" in writer._root_object:
             fields = writer._root_object["/AcroForm"]["/Fields"]
 
-            # Process each field in the data dictionary
+            field_index = None
+            checkbox_states = {}
             for field_name, value in data_dict.items():
-                if isinstance(value, bool):
-                    # Handle checkbox using boolean value
-                    find_and_update_checkbox(fields, field_name, value)
-                else:
-                    # Handle text field
-                    for field in fields:
-                        field_obj = field.get_object()
-                        if "/T" in field_obj and field_name == str(field_obj["/T"]):
-                            field_obj[NameObject("/V")] = TextStringObject(str(value))
-                            break
+                entry = fill_plan.get(field_name)
+                is_bool = isinstance(value, bool)
+
+                # Fields in the fill plan are updated on their annotation directly
+                if entry is not None and entry[2] == is_bool:
+                    page_index, annot_index, _ = entry
+                    annot = writer.pages[page_index]["/Annots"][annot_index].get_object()
+                    if is_bool:
+                        update_checkbox(annot, field_name, value, checkbox_states)
+                    else:
+                        annot[_V] = TextStringObject(str(value))
+                    continue
+
+                # Other fields are looked up by exact name, with or without '[0]'
+                if field_index is None:
+                    field_index = _build_field_index(fields)
+                field_obj = field_index.get(field_name)
+                if is_bool:
+                    if field_obj is not None:
+                        update_checkbox(field_obj, field_name, value, checkbox_states)
+                    else:
+                        # Fall back to a substring search for partial names
+                        find_and_update_checkbox(
+                            fields, field_name, value, checkbox_states
+                        )
+                elif field_obj is not None:
+                    field_obj[_V] = TextStringObject(str(value))
 
             # Ensure proper appearance of form fields
             set_need_appearances_writer(writer)
 
-        # Save the filled PDF
-        with open(output_path, 'wb') as output_file:
-            writer.write(output_file)
+        # Serialize in memory, then move into place so readers never see a partial file
+        buffer = BytesIO()
+        writer.write(buffer)
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as output_file:
+            output_file.write(buffer.getbuffer())
+        os.replace(tmp_path, output_path)
 
     def get_form_fields(self):
-        """Return an ordered dictionary of all fillable form fields with their current values."""
-        fields = OrderedDict()
-
-        for page_num, page in enumerate(self.template_pdf.pages):
-            if page.Annots:
-                # Sort annotations by their vertical position (top to bottom)
-                annotations = []
-                for annot in page.Annots:
-                    if annot.T and hasattr(annot, 'Rect'):
-                        # Get the y-coordinate (vertical position) from the annotation rectangle
-                        y_pos = float(annot.Rect[1])
-                        annotations.append((y_pos, annot))
-
-                # Sort by y-position in descending order (top to bottom)
-                annotations.sort(key=lambda x: x[0], reverse=True)
-
-                # Process sorted annotations
-                for _, annotation in annotations:
-                    raw_key = str(annotation.T)
-                    decoded_key = self.decode_pdf_field_name(raw_key)
-
-                    # Determine if field is a checkbox
-                    is_checkbox = self.is_checkbox(annotation)
-
-                    if annotation.V:
-                        value = str(annotation.V)
-                        if is_checkbox:
-                            # Convert checkbox values to boolean
-                            value = value != "/Off"
-                        fields[decoded_key] = value
-                    else:
-                        fields[decoded_key] = False if is_checkbox else ""
-
-        return fields
-
-    def convert_to_images(self, output_dir="images/"):
+        """Return a dictionary of all fillable form fields with their current values."""
+        self._reload_if_modified()
+        if self._fields_cache is not None:
+            return dict(self._fields_cache)
+
+        fields = {}
+
+        for decoded_key, annotation in self._index_annotations().items():
+            # Determine if field is a checkbox
+            is_checkbox = self.is_checkbox(annotation)
+
+            if annotation.V:
+                value = str(annotation.V)
+                if is_checkbox:
+                    # Convert checkbox values to boolean
+                    value = value != "/Off"
+                fields[decoded_key] = value
+            else:
+                fields[decoded_key] = False if is_checkbox else ""
+
+        self._fields_cache = fields
+        return dict(fields)
+
+    def convert_to_images(self, output_dir="images/", dpi=150, fmt="JPEG"):
         """
         Convert PDF to images (one per page).
 
+        Pages are rendered in parallel worker processes, using PyMuPDF when
+        available and falling back to pdf2image (Poppler).
+
         Args:
             output_dir (str): Directory to save images
+            dpi (int): Rendering resolution; lower is faster and smaller
+            fmt (str): "JPEG" (default, faster and smaller) or "PNG" for lossless
 
         Returns:
             list: Paths to generated images
         """
+        self._reload_if_modified()
         os.makedirs(output_dir, exist_ok=True)
-        images = convert_from_path(self.input_pdf_path)
 
-        image_paths = []
-        for i, image in enumerate(images):
-            image_path = os.path.join(output_dir, f"page_{i + 1}.png")
-            image.save(image_path, "PNG")
-            image_paths.append(image_path)
+        if _import_fitz() is not None:
+            page_count = self.fitz_doc.page_count
+        else:
+            page_count = len(self.pypdf_reader.pages)
 
-        return image_paths
+        # Rasterization is CPU-bound and independent per page
+        jobs = [
+            (self.input_pdf_path, i, output_dir, dpi, fmt) for i in range(page_count)
+        ]
+        with Pool(max(1, min(os.cpu_count() or 1, page_count))) as pool:
+            return pool.starmap(_render_page, jobs)
 
     def extract_text_from_pdf(self):
         """
         Extract text content from PDF.
+
+        Uses PyMuPDF's native text extraction when available, falling back
+        to pypdf. Long documents are split into page ranges extracted in
+        worker processes, since PyMuPDF documents are not thread-safe.
         """
-        reader = PdfReader(self.input_pdf_path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        self._reload_if_modified()
+        if _import_fitz() is not None:
+            page_count = self.fitz_doc.page_count
+            if page_count < PARALLEL_TEXT_MIN_PAGES:
+                return "\n".join(page.get_text("text") for page in self.fitz_doc)
+
+            workers = min(os.cpu_count() or 1, page_count)
+            chunk_size = -(-page_count // workers)
+            jobs = [
+                (self.input_pdf_path, start, min(start + chunk_size, page_count))
+                for start in range(0, page_count, chunk_size)
+            ]
+            with Pool(len(jobs)) as pool:
+                chunks = pool.starmap(_extract_page_texts, jobs)
+            return "\n".join(text for texts in chunks for text in texts)
+
+        reader = self.pypdf_reader
+        return "".join((page.extract_text() or "") + "\n" for page in reader.pages)
 
     def extract_text_from_image(self, image_path):
         """
         Extract text from image using OCR.
+
+        Uses tesserocr's in-process API when available, so the language model
+        is loaded once per processor instead of once per call.
         """
+        if _import_tesserocr() is not None:
+            api = self._get_tess_api()
+            api.SetImageFile(str(image_path))
+            return api.GetUTF8Text()
+
+        import pytesseract
+
         return pytesseract.image_to_string(image_path)
 
+    def extract_text_from_images(self, image_paths, batch_size=50):
+        """
+        Extract text from many images using one Tesseract run per batch.
+
+        Tesseract accepts a text file listing image paths, so its language
+        model is loaded once per batch instead of once per image. Batches are
+        capped since very long lists can hang Tesseract.
+
+        Args:
+            image_paths (list): Paths to images, e.g. from convert_to_images
+            batch_size (int): Maximum number of images per Tesseract run
+
+        Returns:
+            str: Text of all images in order, pages separated by form feeds
+        """
+        if _import_tesserocr() is not None:
+            # The in-process API already loads the model only once
+            return "".join(
+                self.extract_text_from_image(path) + "\f" for path in image_paths
+            )
+
+        import pytesseract
+
+        texts = []
+        for start in range(0, len(image_paths), batch_size):
+            batch = image_paths[start:start + batch_size]
+            with tempfile.NamedTemporaryFile("w", suffix=".txt") as list_file:
+                list_file.write("\n".join(os.path.abspath(p) for p in batch))
+                list_file.flush()
+                texts.append(pytesseract.image_to_string(list_file.name))
+        return "".join(texts)
+
+    def extract_text_from_images_parallel(self, image_paths, config=""):
+        """
+        Extract text from each image in a separate Tesseract worker process.
+
+        Each worker runs Tesseract single-threaded, which keeps every core busy
+        with its own page instead of Tesseract's internal threads working on
+        one page at a time. Use this when images need per-image handling that
+        the batched list-file path in extract_text_from_images cannot give.
+
+        Args:
+            image_paths (list): Paths to images
+            config (str): Extra Tesseract options, e.g. '--oem 1 --psm 6' to
+                          skip layout analysis on uniform single-block pages
+
+        Returns:
+            list: Extracted text for each image, in order
+        """
+        import pytesseract
+
+        ocr = functools.partial(pytesseract.image_to_string, config=config)
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_set_omp_thread_limit,
+            initargs=(1,),
+        ) as executor:
+            return list(executor.map(ocr, image_paths))
+
+
+_worker_processor = None
+
+
+def _init_fill_worker(input_pdf_path):
+    """Parse the form template once per worker process."""
+    global _worker_processor
+    _worker_processor = PDFProcessor(input_pdf_path)
+
+
+def _fill_one(data_dict, output_path):
+    """Fill one form using the worker's processor (process pool worker)."""
+    _worker_processor.fill_form(data_dict, output_path)
+    return output_path
+
+
+def fill_forms_batch(input_pdf_path, jobs):
+    """
+    Fill many copies of the same PDF form in parallel worker processes.
+
+    Args:
+        input_pdf_path (str): Path to the fillable PDF form
+        jobs (list): (data_dict, output_path) tuples, one per filled form
+
+    Returns:
+        list: Output paths, in job order
+    """
+    data_dicts = [data_dict for data_dict, _ in jobs]
+    output_paths = [output_path for _, output_path in jobs]
+
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_fill_worker,
+        initargs=(input_pdf_path,),
+    ) as executor:
+        return list(executor.map(_fill_one, data_dicts, output_paths))
+
 
 # Example usage:
 if __name__ == "__main__":
     # Sample data using boolean values for checkboxes
-    data = OrderedDict([
-        ('TypeOfBenefitsApplyingFor[0]', False),  # Will check the box
-        ('TypeOfBenefitsApplyingFor[1]', True)  # Will uncheck the box
-    ])
+    data = {
+        'TypeOfBenefitsApplyingFor[0]': False,  # Will check the box
+        'TypeOfBenefitsApplyingFor[1]': True  # Will uncheck the box
+    }
 
     try:
         # Initialize processor with your fillable PDF